@@ -2,6 +2,7 @@
 argument parser for bilby_pipe, adapted from configargparse.ArgParser.
 """
 
+import io
 import os
 import re
 import sys
@@ -10,6 +11,10 @@ import configargparse
 
 from .utils import get_version_information, logger
 
+# Parsed config files, keyed by absolute path. Each entry stores the file
+# contents it was parsed from so that any edit invalidates the entry.
+_CONFIG_FILE_CACHE = dict()
+
 
 class HyphenStr(str):
     def __new__(cls, content):
@@ -84,22 +89,53 @@ class BilbyArgParser(configargparse.ArgParser):
         file_contents = None
         config_stream = self._open_config_files(args)
         if config_stream:
-            config_file_parser = BilbyConfigFileParser()
             ini_stream = config_stream.pop()  # get ini file's steam
-            ini_items, numbers, comments, inline_comments = config_file_parser.parse(
-                ini_stream
-            )
-            ini_stream.close()
+            with ini_stream:
+                parsed = self._parse_config_file_stream(ini_stream)
+            file_contents, numbers, comments, inline_comments = parsed
             self.numbers = numbers
             self.comments = comments
             self.inline_comments = inline_comments
-            corrected_items = dict(
-                (key.replace("_", "-"), val) for key, val in ini_items.items()
-            )
-            file_contents = config_file_parser.serialize(corrected_items)
 
         return file_contents
 
+    @staticmethod
+    def _parse_config_file_stream(ini_stream):
+        """Parse an open config file, reusing a previous parse if unchanged
+
+        Parameters
+        ----------
+        ini_stream: file
+            The open config file
+
+        Returns
+        -------
+        parsed: tuple
+            The serialized file contents and the numbers, comments, and
+            inline_comments dictionaries from BilbyConfigFileParser.parse
+        """
+        path = getattr(ini_stream, "name", None)
+        if isinstance(path, str):
+            path = os.path.abspath(path)
+        contents = ini_stream.read()
+
+        cached = _CONFIG_FILE_CACHE.get(path)
+        if cached is not None and cached[0] == contents:
+            logger.debug(f"Using cached parse of config file {path}")
+            return cached[1]
+
+        config_file_parser = BilbyConfigFileParser()
+        ini_items, numbers, comments, inline_comments = config_file_parser.parse(
+            io.StringIO(contents)
+        )
+        corrected_items = dict(
+            (key.replace("_", "-"), val) for key, val in ini_items.items()
+        )
+        file_contents = config_file_parser.serialize(corrected_items)
+        parsed = (file_contents, numbers, comments, inline_comments)
+        _CONFIG_FILE_CACHE[path] = (contents, parsed)
+        return parsed
+
     def _preprocess_args(self, args):
         """Processes args into correct format for ArgParser
 
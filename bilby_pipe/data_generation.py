@@ -901,11 +901,10 @@ class DataGenerationInput(Input):
             kwargs["format"] = self.data_format
 
         try:
-            kwargs_string = ""
-            for key, val in kwargs.items():
-                if isinstance(val, str):
-                    val = f"'{val}'"
-                kwargs_string += f"{key}={val}, "
+            kwargs_string = "".join(
+                f"{key}='{val}', " if isinstance(val, str) else f"{key}={val}, "
+                for key, val in kwargs.items()
+            )
             logger.info(f"Running: gwpy.timeseries.TimeSeries.read({kwargs_string})")
             data = gwpy.timeseries.TimeSeries.read(**kwargs)
 
@@ -57,25 +57,61 @@ def x509userproxy(outdir):
         None if X509_USER_PROXY certificate does not exist, or if
         the X509_USER_PROXY cannot be copied.
     """
-    x509userproxy = None
     cert_alias = "X509_USER_PROXY"
+    cert_path = os.environ.get(cert_alias)
+    if cert_path is None:
+        logger.warning(
+            "Environment variable X509_USER_PROXY not set"
+            " Try running `$ ligo-proxy-init albert.einstein`"
+        )
+        return None
+
+    new_cert_path = os.path.join(outdir, "." + os.path.basename(cert_path))
     try:
-        cert_path = os.environ[cert_alias]
-        new_cert_path = os.path.join(outdir, "." + os.path.basename(cert_path))
-        shutil.copyfile(src=cert_path, dst=new_cert_path)
-        x509userproxy = new_cert_path
+        _link_or_copy_file(src=cert_path, dst=new_cert_path)
     except FileNotFoundError as e:
         logger.warning(
             "Environment variable X509_USER_PROXY does not point to a file. "
             "Error while copying file: {}. "
             "Try running `$ ligo-proxy-init albert.einstein`".format(e)
         )
-    except KeyError:
-        logger.warning(
-            "Environment variable X509_USER_PROXY not set"
-            " Try running `$ ligo-proxy-init albert.einstein`"
-        )
-    return x509userproxy
+        return None
+    return new_cert_path
+
+
+def _link_or_copy_file(src, dst):
+    """Place a copy of src at dst, avoiding a byte-for-byte copy if possible
+
+    If dst is already a hard link to src, or matches it (same modification
+    time and size), nothing is done. Otherwise dst is hard-linked to src,
+    falling back to a full copy when a link is not possible (e.g., src and
+    dst are on different devices).
+
+    Parameters
+    ----------
+    src: str
+        Path to the file to copy
+    dst: str
+        Path to the destination file
+    """
+    src_stat = os.stat(src)
+    try:
+        dst_stat = os.stat(dst)
+    except FileNotFoundError:
+        pass
+    else:
+        if os.path.samestat(src_stat, dst_stat) or (
+            (src_stat.st_mtime_ns, src_stat.st_size)
+            == (dst_stat.st_mtime_ns, dst_stat.st_size)
+        ):
+            logger.debug(f"File {dst} is up to date with {src}")
+            return
+        os.remove(dst)
+
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src=src, dst=dst)
 
 
 def read_from_gracedb(gracedb, gracedb_url, outdir):
@@ -5,6 +5,7 @@ Module containing the main input class
 import glob
 import inspect
 import json
+import logging
 import os
 from importlib import import_module
 
@@ -27,10 +28,17 @@ from .utils import (
     pretty_print_dictionary,
 )
 
+# Translation table mapping commas to spaces and dropping brackets and quotes
+_STRING_TO_LIST_TABLE = str.maketrans(",", " ", "[]\"'")
+
 
 class Input(object):
     """ Superclass of input handlers """
 
+    # Default known detectors, copied into a list owned by the instance on
+    # the first read of known_detectors or replaced by its setter
+    _known_detectors = ("H1", "L1", "V1", "ET", "CE")
+
     @property
     def complete_ini_file(self):
         return f"{self.outdir}/{self.label}_config_complete.ini"
@@ -46,10 +54,10 @@ class Input(object):
 
     @property
     def known_detectors(self):
-        try:
-            return self._known_detectors
-        except AttributeError:
-            return ["H1", "L1", "V1", "ET", "CE"]
+        if isinstance(self._known_detectors, tuple):
+            # Copy the shared class default into a list owned by this instance
+            self._known_detectors = list(self._known_detectors)
+        return self._known_detectors
 
     @known_detectors.setter
     def known_detectors(self, known_detectors):
@@ -66,28 +74,18 @@ class Input(object):
         self._check_detectors_against_known_detectors()
 
     def _check_detectors_against_known_detectors(self):
-        for element in self.detectors:
-            if element not in self.known_detectors:
-                raise BilbyPipeError(
-                    'detectors contains "{}" not in the known '
-                    "detectors list: {} ".format(element, self.known_detectors)
-                )
-
-    @staticmethod
-    def _split_string_by_space(string):
-        """ Converts "H1 L1" to ["H1", "L1"] """
-        return string.split(" ")
+        unknown_detectors = set(self.detectors).difference(self._known_detectors)
+        if unknown_detectors:
+            element = next(det for det in self.detectors if det in unknown_detectors)
+            raise BilbyPipeError(
+                'detectors contains "{}" not in the known '
+                "detectors list: {} ".format(element, self.known_detectors)
+            )
 
     @staticmethod
     def _convert_string_to_list(string):
         """ Converts various strings to a list """
-        string = string.replace(",", " ")
-        string = string.replace("[", "")
-        string = string.replace("]", "")
-        string = string.replace('"', "")
-        string = string.replace("'", "")
-        string_list = string.split()
-        return string_list
+        return string.translate(_STRING_TO_LIST_TABLE).split()
 
     @property
     def outdir(self):
@@ -97,7 +95,7 @@ class Input(object):
 
     @outdir.setter
     def outdir(self, outdir):
-        self._outdir = os.path.relpath(outdir)
+        self._outdir = utils.relative_path(outdir)
 
     @property
     def submit_directory(self):
@@ -122,21 +120,21 @@ class Input(object):
     @property
     def data_generation_log_directory(self):
         """ The path to the directory where generation logs will be stored """
-        path = os.path.join(self.log_directory, "log_data_generation")
+        path = os.path.join(self._log_directory, "log_data_generation")
         utils.check_directory_exists_and_if_not_mkdir(path)
         return path
 
     @property
     def data_analysis_log_directory(self):
         """ The path to the directory where analysis logs will be stored """
-        path = os.path.join(self.log_directory, "log_data_analysis")
+        path = os.path.join(self._log_directory, "log_data_analysis")
         utils.check_directory_exists_and_if_not_mkdir(path)
         return path
 
     @property
     def summary_log_directory(self):
         """ The path to the directory where pesummary logs will be stored """
-        path = os.path.join(self.log_directory, "log_results_page")
+        path = os.path.join(self._log_directory, "log_results_page")
         utils.check_directory_exists_and_if_not_mkdir(path)
         return path
 
@@ -367,7 +365,8 @@ class Input(object):
         if self.waveform_arguments_dict is not None:
             wfa.update(convert_string_to_dict(self.waveform_arguments_dict))
 
-        logger.debug(f"Default waveform_arguments: {pretty_print_dictionary(wfa)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Default waveform_arguments: {pretty_print_dictionary(wfa)}")
         return wfa
 
     def get_injection_waveform_arguments(self):
@@ -1084,9 +1083,10 @@ class Input(object):
             if key in inspect.getfullargspec(Likelihood.__init__).args
         }
 
-        logger.debug(
-            f"Initialise likelihood {Likelihood} with kwargs: \n{likelihood_kwargs}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Initialise likelihood {Likelihood} with kwargs: \n{likelihood_kwargs}"
+            )
 
         return Likelihood(**likelihood_kwargs)
 
@@ -1246,7 +1246,7 @@ class Input(object):
         elif postprocessing_arguments == [None]:
             self._postprocessing_arguments = None
         elif isinstance(postprocessing_arguments, str):
-            self._postprocessing_arguments = postprocessing_arguments.split(" ")
+            self._postprocessing_arguments = postprocessing_arguments.split()
         else:
             self._postprocessing_arguments = postprocessing_arguments
 
@@ -1307,5 +1307,5 @@ class Input(object):
             raise BilbyPipeError(
                 get_colored_string(f"Unable to parse prior, exception raised {e}")
             )
-        pp = pretty_print_dictionary(prior)
-        logger.info(f"Input prior = {pp}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Input prior = {pretty_print_dictionary(prior)}")
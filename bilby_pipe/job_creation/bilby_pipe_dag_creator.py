@@ -1,3 +1,5 @@
+import logging
+
 import numpy as np
 
 from ..utils import BilbyPipeError, convert_string_to_tuple, logger
@@ -31,16 +33,16 @@ def get_trigger_time_list(inputs):
         trigger_times = start_times + inputs.duration - inputs.post_trigger_duration
     else:
         raise BilbyPipeError("Unable to determine input trigger times from ini file")
-    logger.info(f"Setting segment trigger-times {trigger_times}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"Setting segment trigger-times {trigger_times}")
     return trigger_times
 
 
 def get_detectors_list(inputs):
-    detectors_list = []
-    detectors_list.append(inputs.detectors)
+    detectors = tuple(inputs.detectors)
+    detectors_list = [detectors]
     if inputs.coherence_test:
-        for detector in inputs.detectors:
-            detectors_list.append([detector])
+        detectors_list.extend((detector,) for detector in detectors)
     return detectors_list
 
 
@@ -1,8 +1,6 @@
 import os
 import sys
 
-import pycondor
-
 from ..utils import logger
 from . import slurm
 
@@ -14,6 +12,7 @@ class Dag(object):
         self.inputs = inputs
         self.dag_name = f"dag_{inputs.label}"
         self.submit_directory = inputs.submit_directory
+        self.initialdir = inputs.initialdir
 
         self.scheduler = self.inputs.scheduler
         self.scheduler_args = self.inputs.scheduler_args
@@ -26,9 +25,17 @@ class Dag(object):
             self.setup_pycondor_dag()
 
     def setup_pycondor_dag(self):
+        import pycondor
+
         self.pycondor_dag = pycondor.Dagman(
             name=self.dag_name, submit=self.submit_directory
         )
+        # Job keyword arguments shared by every node in the dag
+        self.pycondor_job_kwargs = dict(
+            submit=self.submit_directory,
+            initialdir=self.initialdir,
+            dag=self.pycondor_dag,
+        )
 
     def build(self):
         if self.inputs.scheduler.lower() == "condor":
@@ -54,8 +61,8 @@ class Dag(object):
         if submitted:
             logger.info("DAG generation complete and submitted")
         else:
-            command_line = "$ condor_submit_dag {}".format(
-                os.path.relpath(self.pycondor_dag.submit_file)
+            command_line = (
+                f"$ condor_submit_dag {os.path.relpath(self.pycondor_dag.submit_file)}"
             )
             logger.info(
                 f"DAG generation complete, to submit jobs run:\n  {command_line}"
@@ -65,9 +72,8 @@ class Dag(object):
         if "--create-dag-plot" in sys.argv:
             try:
                 self.pycondor_dag.visualize(
-                    "{}/{}_visualization.png".format(
-                        self.submit_directory, self.pycondor_dag.name
-                    )
+                    f"{self.submit_directory}/"
+                    f"{self.pycondor_dag.name}_visualization.png"
                 )
             except Exception:
                 pass
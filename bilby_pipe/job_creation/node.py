@@ -4,10 +4,12 @@ import shutil
 import subprocess
 from pathlib import Path
 
-import pycondor
-
 from ..utils import CHECKPOINT_EXIT_CODE, ArgumentsString, BilbyPipeError, logger
 
+# Resolved executable paths, shared by all nodes so that each name only
+# triggers a single search of the PATH
+_EXECUTABLE_PATH_CACHE = dict()
+
 
 class Node(object):
     """ Base Node object, handles creation of arguments, executables, etc """
@@ -46,8 +48,11 @@ class Node(object):
 
     @staticmethod
     def _get_executable_path(exe_name):
+        if exe_name in _EXECUTABLE_PATH_CACHE:
+            return _EXECUTABLE_PATH_CACHE[exe_name]
         exe = shutil.which(exe_name)
         if exe is not None:
+            _EXECUTABLE_PATH_CACHE[exe_name] = exe
             return exe
         else:
             raise OSError(f"{exe_name} not installed on this system, unable to proceed")
@@ -75,6 +80,8 @@ class Node(object):
         raise NotImplementedError()
 
     def create_pycondor_job(self):
+        import pycondor
+
         job_name = self.job_name
         self.extra_lines.extend(
             _log_output_error_submit_lines(self.log_directory, job_name)
@@ -109,20 +116,18 @@ class Node(object):
         self.job = pycondor.Job(
             name=job_name,
             executable=self.executable,
-            submit=self.inputs.submit_directory,
             request_memory=self.request_memory,
             request_disk=self.request_disk,
             request_cpus=self.request_cpus,
             getenv=self.getenv,
             universe=self.universe,
-            initialdir=self.inputs.initialdir,
             notification=self.notification,
             requirements=" && ".join(self.requirements),
             extra_lines=self.extra_lines,
-            dag=self.dag.pycondor_dag,
             arguments=self.arguments.print(),
             retry=self.retry,
             verbose=self.verbose,
+            **self.dag.pycondor_job_kwargs,
         )
 
         # Hack to allow passing walltime down to slurm
@@ -226,9 +231,5 @@ def _log_output_error_submit_lines(logdir, prefix):
      'output = test/job.out',
      'error = test/job.err']
     """
-    logpath = Path(logdir)
-    filename = f"{prefix}.{{}}"
-    return [
-        f"{opt} = {str(logpath / filename.format(opt[:3]))}"
-        for opt in ("log", "output", "error")
-    ]
+    base = str(Path(logdir) / prefix)
+    return [f"log = {base}.log", f"output = {base}.out", f"error = {base}.err"]
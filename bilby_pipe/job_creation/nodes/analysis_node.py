@@ -23,6 +23,7 @@ class AnalysisNode(Node):
         else:
             self.job_name = self.base_job_name
         self.label = self.job_name
+        self.result_file = f"{self.inputs.result_directory}/{self.job_name}_result.json"
 
         if self.inputs.use_mpi:
             self.setup_arguments(
@@ -32,8 +33,9 @@ class AnalysisNode(Node):
         else:
             self.setup_arguments()
 
+        data_dump_file = generation_node.data_dump_file
         if self.inputs.transfer_files or self.inputs.osg:
-            data_dump_file = generation_node.data_dump_file
+            outdir = self.inputs.outdir
             input_files_to_transfer = [
                 str(data_dump_file),
                 str(self.inputs.complete_ini_file),
@@ -41,15 +43,15 @@ class AnalysisNode(Node):
             self.extra_lines.extend(
                 self._condor_file_transfer_lines(
                     input_files_to_transfer,
-                    [self._relative_topdir(self.inputs.outdir, self.inputs.initialdir)],
+                    [self._relative_topdir(outdir, self.dag.initialdir)],
                 )
             )
-            self.arguments.add("outdir", os.path.relpath(self.inputs.outdir))
+            self.arguments.add("outdir", os.path.relpath(outdir))
 
         for det in detectors:
             self.arguments.add("detectors", det)
         self.arguments.add("label", self.label)
-        self.arguments.add("data-dump-file", generation_node.data_dump_file)
+        self.arguments.add("data-dump-file", data_dump_file)
         self.arguments.add("sampler", sampler)
 
         self.extra_lines.extend(self._checkpoint_submit_lines())
@@ -74,10 +76,6 @@ class AnalysisNode(Node):
     def log_directory(self):
         return self.inputs.data_analysis_log_directory
 
-    @property
-    def result_file(self):
-        return f"{self.inputs.result_directory}/{self.job_name}_result.json"
-
     @property
     def slurm_walltime(self):
         """ Default wall-time for base-name """
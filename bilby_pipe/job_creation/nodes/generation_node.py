@@ -68,9 +68,7 @@ class GenerationNode(Node):
 
     @property
     def job_name(self):
-        job_name = "{}_data{}_{}_generation".format(
-            self.inputs.label, str(self.idx), self.trigger_time
-        )
+        job_name = f"{self.inputs.label}_data{self.idx}_{self.trigger_time}_generation"
         job_name = job_name.replace(".", "-")
         return job_name
 
@@ -8,6 +8,7 @@ class MergeNode(Node):
 
         self.job_name = f"{parallel_node_list[0].base_job_name}_merge"
         self.label = f"{parallel_node_list[0].base_job_name}_merge"
+        self.result_file = f"{self.inputs.result_directory}/{self.label}_result.json"
         self.request_cpus = 1
         self.setup_arguments(
             add_ini=False, add_unknown_args=False, add_command_line_args=False
@@ -34,7 +35,3 @@ class MergeNode(Node):
     @property
     def log_directory(self):
         return self.inputs.data_analysis_log_directory
-
-    @property
-    def result_file(self):
-        return f"{self.inputs.result_directory}/{self.label}_result.json"
@@ -4,8 +4,6 @@ Module to create a lightweight overview page for a run
 """
 from os.path import abspath, relpath
 
-from jinja2 import Template
-
 from ..utils import logger
 
 
@@ -28,6 +26,7 @@ def create_overview(
         List of plot node jobs
 
     """
+    from jinja2 import Template
 
     index_file_dir = inputs.webdir
     index_file = f"{index_file_dir}/overview.html"
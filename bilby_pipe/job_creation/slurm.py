@@ -4,6 +4,7 @@ Module containing the tools for outputting slurm submission scripts
 """
 
 import os
+import shlex
 import subprocess
 
 from ..utils import logger
@@ -13,7 +14,7 @@ class SubmitSLURM(object):
     def __init__(self, dag):
 
         self.dag = dag.pycondor_dag
-        self.submit_dir = dag.inputs.submit_directory
+        self.submit_dir = dag.submit_directory
         self.submit = dag.inputs.submit
         self.label = dag.inputs.label
         self.scheduler = dag.scheduler
@@ -21,18 +22,23 @@ class SubmitSLURM(object):
         self.scheduler_module = dag.scheduler_module
         self.scheduler_env = dag.scheduler_env
         self.scheduler_analysis_time = dag.scheduler_analysis_time
+        self._process_header = self._individual_process_header()
 
     def run_local_generation(self):
-        for node in self.dag.nodes:
-            if "_generation" in node.name:
-                # Run the job locally
-                cmd = " ".join([node.executable, node.args[0].arg])
-                subprocess.run(cmd, shell=True)
-                # Remove the children
-                for other_node in self.dag.nodes:
-                    if node in other_node.parents:
-                        other_node.parents.remove(node)
-                self.dag.nodes.remove(node)
+        generation_nodes = [
+            node for node in self.dag.nodes if "_generation" in node.name
+        ]
+        for node in generation_nodes:
+            # Run the job locally, without an intermediate shell
+            cmd = [node.executable] + shlex.split(node.args[0].arg)
+            subprocess.run(cmd)
+            # Remove the node from the parents of its children
+            for child in node.children:
+                child.parents.remove(node)
+
+        # Remove all the locally-run nodes in a single pass over the dag
+        local_nodes = set(generation_nodes)
+        self.dag.nodes[:] = [node for node in self.dag.nodes if node not in local_nodes]
 
     def write_master_slurm(self):
         """
@@ -44,7 +50,7 @@ class SubmitSLURM(object):
             # reformat slurm options
             if self.scheduler_args is not None:
                 slurm_args = " ".join(
-                    ["--{}".format(arg) for arg in self.scheduler_args.split()]
+                    [f"--{arg}" for arg in self.scheduler_args.split()]
                 )
             else:
                 slurm_args = ""
@@ -82,16 +88,19 @@ class SubmitSLURM(object):
 
             for node, indx in zip(self.dag.nodes, jids):
                 # Generate the real slurm arguments from the dag node and the parsed slurm args
-                job_slurm_args = slurm_args
-                job_slurm_args += " --nodes=1"
-                job_slurm_args += f" --ntasks-per-node={node.request_cpus}"
-                job_slurm_args += " --mem={}G".format(
-                    int(float(node.request_memory.split(" ")[0]))
+                memory = int(float(node.request_memory.split(" ")[0]))
+                job_slurm_args = " ".join(
+                    [
+                        slurm_args,
+                        "--nodes=1",
+                        f"--ntasks-per-node={node.request_cpus}",
+                        f"--mem={memory}G",
+                        f"--time={node.slurm_walltime}",
+                        f"--job-name={node.name}",
+                    ]
                 )
-                job_slurm_args += f" --time={node.slurm_walltime}"
-                job_slurm_args += f" --job-name={node.name}"
 
-                submit_str = f"\njid{indx}=($(sbatch {job_slurm_args} "
+                submit_parts = [f"\njid{indx}=($(sbatch {job_slurm_args} "]
 
                 # get list of all parents associated with job
                 parents = [job.name for job in node.parents]
@@ -99,58 +108,62 @@ class SubmitSLURM(object):
                 if len(parents) > 0:
                     # only run subsequent jobs after parent has
                     # *successfully* completed
-                    submit_str += "--dependency=afterok"
+                    submit_parts.append("--dependency=afterok")
+                    submit_parts.extend(
+                        f":${{jid{job_dict[parent]}[-1]}}" for parent in parents
+                    )
 
-                    for parent in parents:
-                        submit_str += f":${{jid{job_dict[parent]}[-1]}}"
                 # get output file path from dag and use for slurm
                 output_file = self._output_name_from_dag(node.extra_lines)
 
-                submit_str += f" --output={output_file}"
-                submit_str += f" --error={output_file.replace('.out', '.err')}"
+                submit_parts.append(f" --output={output_file}")
+                submit_parts.append(f" --error={output_file.replace('.out', '.err')}")
 
                 job_script = self._write_individual_processes(
                     node.name, node.executable, node.args[0].arg
                 )
 
-                submit_str += f" {job_script}))\n\n"
-                submit_str += (
-                    f'echo "jid{indx} ${{jid{indx}[-1]}}" >> {self.slurm_id_file}'
+                submit_parts.append(f" {job_script}))\n\n")
+                submit_parts.append(
+                    f'echo "jid{indx} ${{jid{indx}[-1]}}" >> {self.slurm_id_file}\n'
                 )
 
-                f.write(f"{submit_str}\n")
+                f.write("".join(submit_parts))
 
         # print out how to submit
         command_line = f"sbatch {self.slurm_master_bash}"
 
         if self.submit:
-            subprocess.run([command_line], shell=True)
+            subprocess.run(["sbatch", self.slurm_master_bash])
         else:
             logger.info(f"slurm scripts written, to run jobs submit:\n$ {command_line}")
 
-    def _write_individual_processes(self, name, executable, args):
-
-        fname = name + ".sh"
-        job_path = self.submit_dir + "/" + fname
+    def _individual_process_header(self):
+        """ The environment set-up shared by all individual process scripts """
+        header = ["#!/bin/bash\n"]
+        if self.scheduler_module:
+            for module in self.scheduler_module:
+                if module is not None:
+                    header.append(f"\nmodule load {module}\n")
+        if self.scheduler_env is not None:
+            header.append(f"\nsource activate {self.scheduler_env}\n\n")
+        return "".join(header)
 
-        with open(job_path, "w") as ff:
+    def _write_individual_processes(self, name, executable, args):
 
-            ff.write("#!/bin/bash\n")
+        fname = f"{name}.sh"
+        job_path = f"{self.submit_dir}/{fname}"
 
-            if self.scheduler_module:
-                for module in self.scheduler_module:
-                    if module is not None:
-                        ff.write(f"\nmodule load {module}\n")
-
-            if self.scheduler_env is not None:
-                ff.write(f"\nsource activate {self.scheduler_env}\n\n")
-                # Call python from the venv on the script directly to avoid
-                # "bad interpreter" from shebang exceeding 128 chars
-                job_str = f"python {executable} {args}\n\n"
-            else:
-                job_str = f"{executable} {args}\n\n"
+        if self.scheduler_env is not None:
+            # Call python from the venv on the script directly to avoid
+            # "bad interpreter" from shebang exceeding 128 chars
+            job_str = f"python {executable} {args}\n\n"
+        else:
+            job_str = f"{executable} {args}\n\n"
 
-            ff.write(job_str)
+        # Write the whole script in a single call
+        with open(job_path, "w") as ff:
+            ff.write(self._process_header + job_str)
 
         return job_path
 
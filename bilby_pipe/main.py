@@ -14,6 +14,7 @@ $ bilby_pipe config.ini --submit
 will build and submit the job.
 """
 import json
+import logging
 import os
 
 import numpy as np
@@ -22,13 +23,14 @@ import pandas as pd
 from .create_injections import create_injection_file
 from .input import Input
 from .job_creation import generate_dag
-from .parser import create_parser
+from .parser import create_parser, create_version_parser
 from .utils import (
     BilbyPipeError,
     get_command_line_arguments,
     log_version_information,
     logger,
     parse_args,
+    relative_path,
     request_memory_generation_lookup,
     tcolors,
 )
@@ -39,7 +41,8 @@ class MainInput(Input):
 
     def __init__(self, args, unknown_args):
         logger.debug("Creating new Input object")
-        logger.debug(f"Command line arguments: {args}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Command line arguments: {args}")
 
         self.known_args = args
         self.unknown_args = unknown_args
@@ -147,7 +150,7 @@ class MainInput(Input):
     def ini(self, ini):
         if os.path.isfile(ini) is False:
             raise FileNotFoundError(f"No ini file {ini} found")
-        self._ini = os.path.relpath(ini)
+        self._ini = relative_path(ini)
 
     @property
     def notification(self):
@@ -256,8 +259,8 @@ class MainInput(Input):
         injection-file, or create an injection-file
 
         """
-        default_injection_file_name = "{}/{}_injection_file.dat".format(
-            self.data_directory, self.label
+        default_injection_file_name = (
+            f"{self.data_directory}/{self.label}_injection_file.dat"
         )
         if self.injection_dict is not None:
             logger.info(
@@ -385,8 +388,10 @@ def perform_runtime_checks(inputs, args):
 
 def main():
     """ Top-level interface for bilby_pipe """
+    command_line_arguments = get_command_line_arguments()
+    create_version_parser().parse_known_args(command_line_arguments)
     parser = create_parser(top_level=True)
-    args, unknown_args = parse_args(get_command_line_arguments(), parser)
+    args, unknown_args = parse_args(command_line_arguments, parser)
     log_version_information()
     inputs = MainInput(args, unknown_args)
     perform_runtime_checks(inputs, args)
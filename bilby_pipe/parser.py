@@ -31,6 +31,27 @@ class StoreBoolean(argparse.Action):
             setattr(namespace, self.dest, False)
 
 
+def _version_string():
+    return f"%(prog)s={__version__}\nbilby={bilby.__version__}"
+
+
+def create_version_parser():
+    """Creates a minimal argparse parser which only handles --version
+
+    This allows `bilby_pipe --version` to be answered without building the
+    full BilbyArgParser; all other arguments are returned as unknown.
+
+    Returns
+    -------
+    parser: argparse.ArgumentParser instance
+        Argument parser
+
+    """
+    parser = argparse.ArgumentParser(usage=usage, add_help=False, allow_abbrev=False)
+    parser.add_argument("--version", action="version", version=_version_string())
+    return parser
+
+
 def create_parser(top_level=True):
     """Creates the BilbyArgParser for bilby_pipe
 
@@ -58,7 +79,7 @@ def create_parser(top_level=True):
     parser.add(
         "--version",
         action="version",
-        version=f"%(prog)s={__version__}\nbilby={bilby.__version__}",
+        version=_version_string(),
     )
 
     calibration_parser = parser.add_argument_group(
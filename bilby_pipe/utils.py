@@ -115,7 +115,7 @@ class DataDump(object):
 
     def to_pickle(self):
         with open(self.filename, "wb+") as file:
-            pickle.dump(self, file)
+            pickle.dump(self, file, protocol=4)
 
     @classmethod
     def from_pickle(cls, filename=None):
@@ -288,6 +288,31 @@ def check_directory_exists_and_if_not_mkdir(directory):
         logger.debug(f"Directory {directory} exists")
 
 
+def relative_path(path):
+    """Return path relative to the current working directory
+
+    Equivalent to `os.path.relpath(path)`, but relative paths which stay
+    below the current directory are only normalised, avoiding the calls to
+    `os.getcwd` and `os.path.abspath` made by `os.path.relpath`.
+
+    Parameters
+    ----------
+    path: str
+        The path to convert
+
+    Returns
+    -------
+    relative_path: str
+        The path relative to the current working directory
+
+    """
+    if path and not os.path.isabs(path):
+        normalised = os.path.normpath(path)
+        if not normalised.startswith(os.pardir):
+            return normalised
+    return os.path.relpath(path)
+
+
 def setup_logger(outdir=None, label=None, log_level="INFO"):
     """Setup logging output: call at the start of the script to use
 
@@ -623,6 +648,18 @@ def get_geocent_time_with_uncertainty(geocent_time, uncertainty):
     return geocent_time_prior.sample()
 
 
+def _is_canonical_detectors_list(detectors):
+    """ Check if a list is already sorted, unique, upper-case detector names """
+    return (
+        len(detectors) > 0
+        and all(
+            isinstance(det, str) and det.isalnum() and det.isupper()
+            for det in detectors
+        )
+        and all(first < second for first, second in zip(detectors, detectors[1:]))
+    )
+
+
 def convert_detectors_input(string):
     """Convert string inputs into a standard form for the detectors
 
@@ -634,12 +671,14 @@ def convert_detectors_input(string):
     Returns
     -------
     detectors: list
-        A sorted list of detectors
+        A sorted list of the unique, upper-case detectors
 
     """
     if string is None:
         raise BilbyPipeError("No detector input")
     if isinstance(string, list):
+        if _is_canonical_detectors_list(string):
+            return list(string)
         string = ",".join(string)
     if isinstance(string, str) is False:
         raise BilbyPipeError(f"Detector input {string} not understood")
@@ -652,11 +691,7 @@ def convert_detectors_input(string):
     # Spaces can be either space or comma in input, convert to comma
     string = string.replace(" ,", ",").replace(", ", ",").replace(" ", ",")
 
-    detectors = string.split(",")
-
-    detectors.sort()
-    detectors = [det.upper() for det in detectors]
-    return detectors
+    return sorted({det.upper() for det in string.split(",")})
 
 
 def convert_prior_string_input(string):
@@ -4,10 +4,11 @@ import sys
 import unittest
 from unittest.mock import patch
 
+from bilby_pipe import bilbyargparser
 from bilby_pipe.bilbyargparser import BilbyArgParser
 from bilby_pipe.data_analysis import create_analysis_parser
 from bilby_pipe.main import parse_args
-from bilby_pipe.parser import create_parser
+from bilby_pipe.parser import create_parser, create_version_parser
 from bilby_pipe.utils import convert_string_to_dict
 
 
@@ -64,6 +65,17 @@ class TestBilbyArgParser(unittest.TestCase):
         self.assertNotEqual(args.detectors, ["'H1'", "'L1'"], args.detectors)
         self.assertEqual(args.detectors, ["H1", "L1"], args.detectors)
 
+    def test_version_parser_ignores_other_args(self):
+        args_list = ["tests/test_dag_ini_file.ini", "--help", "-v"]
+        parser = create_version_parser()
+        args, unknown_args = parser.parse_known_args(args_list)
+        self.assertEqual(unknown_args, args_list)
+
+    def test_version_parser_exits(self):
+        parser = create_version_parser()
+        with patch("sys.stdout"), self.assertRaises(SystemExit):
+            parser.parse_known_args(["tests/test_dag_ini_file.ini", "--version"])
+
 
 class TestBilbyConfigFileParser(unittest.TestCase):
     def setUp(self):
@@ -94,6 +106,13 @@ class TestBilbyConfigFileParser(unittest.TestCase):
         args, unknown_args = parse_args([self.test_ini_filename], self.parser)
         self.assertEqual(args.accounting, "test")
 
+    def test_create_parser_returns_independent_parsers(self):
+        parser = create_parser(top_level=False)
+        parser.add("--extra-test-option")
+        other_parser = create_parser(top_level=False)
+        self.assertIsNot(other_parser, parser)
+        other_parser.add("--extra-test-option")
+
     def test_sampler_kwargs_flat(self):
         kwargs_expected = dict(walks=1000)
         lines = ["sampler-kwargs: {walks:1000}"]
@@ -151,6 +170,33 @@ class TestBilbyConfigFileParser(unittest.TestCase):
         args, unknown_args = parse_args([self.test_ini_filename], self.parser)
         self.assertEqual(args.prior_dict, kwargs_str)
 
+    def test_repeated_parse_uses_cache(self):
+        self.write_tempory_ini_file([])
+        parse_args([self.test_ini_filename], self.parser)
+        self.assertIn(self.test_ini_filename, bilbyargparser._CONFIG_FILE_CACHE)
+        with patch.object(bilbyargparser.BilbyConfigFileParser, "parse") as mock:
+            args, unknown_args = parse_args([self.test_ini_filename], self.parser)
+            mock.assert_not_called()
+        self.assertEqual(args.accounting, "test")
+
+    def test_modified_file_is_reparsed(self):
+        self.write_tempory_ini_file([])
+        parse_args([self.test_ini_filename], self.parser)
+        self.write_tempory_ini_file(["label: modified"])
+        args, unknown_args = parse_args([self.test_ini_filename], self.parser)
+        self.assertEqual(args.label, "modified")
+
+    def test_rewrite_with_same_size_and_mtime_is_reparsed(self):
+        self.write_tempory_ini_file(["label: first"])
+        parse_args([self.test_ini_filename], self.parser)
+        stat = os.stat(self.test_ini_filename)
+        with open(self.test_ini_filename, "w") as file:
+            print("label: other\naccounting: test", file=file)
+        os.utime(self.test_ini_filename, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertEqual(os.stat(self.test_ini_filename).st_size, stat.st_size)
+        args, unknown_args = parse_args([self.test_ini_filename], self.parser)
+        self.assertEqual(args.label, "other")
+
     def test_prior_dict_multiline(self):
         kwargs_str = "{a: Uniform(name='a', minimum=0, maximum=1), b: 1}"
         lines = ["prior-dict: {a: Uniform(name='a', minimum=0, maximum=1)", "b: 1}"]
@@ -2,6 +2,7 @@ import glob
 import os
 import shutil
 import unittest
+from unittest.mock import patch
 
 from bilby_pipe import gracedb
 from bilby_pipe.utils import BilbyPipeError
@@ -48,6 +49,29 @@ class TestGraceDB(unittest.TestCase):
 
         self.assertEqual(out, new_cert_path)
 
+    def test_x509userproxy_repeated_call_reuses_file(self):
+        cert_alias_path = os.path.join(self.cert_dummy_path, CERT_ALIAS)
+        with open(cert_alias_path, "w") as temp_cert:
+            temp_cert.write("this is a test")
+        os.environ[CERT_ALIAS] = cert_alias_path
+
+        out = gracedb.x509userproxy(outdir=self.outdir)
+        with open(out, "r") as new_cert:
+            self.assertEqual(new_cert.read(), "this is a test")
+        with patch("os.link") as mock_link, patch("shutil.copy2") as mock_copy:
+            self.assertEqual(gracedb.x509userproxy(outdir=self.outdir), out)
+            mock_link.assert_not_called()
+            mock_copy.assert_not_called()
+
+    def test_x509userproxy_is_hard_linked(self):
+        cert_alias_path = os.path.join(self.cert_dummy_path, CERT_ALIAS)
+        with open(cert_alias_path, "w") as temp_cert:
+            temp_cert.write("this is a test")
+        os.environ[CERT_ALIAS] = cert_alias_path
+
+        out = gracedb.x509userproxy(outdir=self.outdir)
+        self.assertTrue(os.path.samefile(out, cert_alias_path))
+
     def test_x509userproxy_no_cert(self):
         """
         No X509_USER_PROXY present, so gracedb.x509userprox is None
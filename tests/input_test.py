@@ -1,6 +1,7 @@
 import os
 import unittest
-from shutil import copyfile
+from shutil import copyfile, rmtree
+from unittest.mock import patch
 
 import pandas as pd
 
@@ -25,15 +26,29 @@ class TestInput(unittest.TestCase):
         inputs.idx = 1
         self.assertEqual(inputs.idx, 1)
 
-    def test_split_by_space(self):
+    def test_postprocessing_arguments_split_on_whitespace(self):
         inputs = bilby_pipe.main.Input()
-        out = inputs._split_string_by_space("H1 L1")
-        self.assertEqual(out, ["H1", "L1"])
+        inputs.postprocessing_arguments = " --a  1\t--b "
+        self.assertEqual(inputs.postprocessing_arguments, ["--a", "1", "--b"])
 
     def test_known_detectors(self):
         inputs = bilby_pipe.main.Input()
         self.assertEqual(inputs.known_detectors, ["H1", "L1", "V1"])
 
+    def test_known_detectors_default_not_shared(self):
+        inputs = bilby_pipe.main.Input()
+        inputs.known_detectors.append("G1")
+        self.assertNotIn("G1", bilby_pipe.main.Input().known_detectors)
+
+    def test_known_detectors_edited_in_place(self):
+        inputs = bilby_pipe.main.Input()
+        inputs.known_detectors.append("G1")
+        self.assertIn("G1", inputs.known_detectors)
+        inputs.known_detectors = ["H1"]
+        self.assertIs(inputs.known_detectors, inputs.known_detectors)
+        inputs.known_detectors.append("K1")
+        self.assertEqual(inputs.known_detectors, ["H1", "K1"])
+
     def test_set_known_detectors_list(self):
         inputs = bilby_pipe.main.Input()
         inputs.known_detectors = ["G1"]
@@ -76,6 +91,12 @@ class TestInput(unittest.TestCase):
         inputs.detectors = ["G1", "L1"]
         self.assertEqual(inputs.detectors, ["G1", "L1"])
 
+    def test_unknown_detector_named_in_error(self):
+        inputs = bilby_pipe.main.Input()
+        with self.assertRaises(BilbyPipeError) as context:
+            inputs.detectors = ["H1", "X1", "L1"]
+        self.assertIn('"X1"', str(context.exception))
+
     def test_convert_string_to_list(self):
         for string in [
             "H1 L1",
@@ -203,6 +224,22 @@ class TestInput(unittest.TestCase):
         inputs.webdir = None
         self.assertEqual(inputs.webdir, "results/results_page")
 
+    def test_outdir_setter_uses_relative_path(self):
+        inputs = bilby_pipe.main.Input()
+        with patch("bilby_pipe.utils.relative_path", return_value="rel") as mock:
+            inputs.outdir = "/some/outdir"
+        mock.assert_called_once_with("/some/outdir")
+        self.assertEqual(inputs._outdir, "rel")
+
+    def test_log_subdirectory_created_with_parents(self):
+        inputs = bilby_pipe.main.Input()
+        inputs.outdir = "outdir_log_test"
+        inputs.log_directory = "outdir_log_test/logs"
+        self.addCleanup(rmtree, "outdir_log_test")
+        path = inputs.data_analysis_log_directory
+        self.assertEqual(path, "outdir_log_test/logs/log_data_analysis")
+        self.assertTrue(os.path.isdir(path))
+
     def test_default_start_time(self):
         inputs = bilby_pipe.main.Input()
         inputs.trigger_time = 2
@@ -224,7 +224,7 @@ class TestMainInput(unittest.TestCase):
         det_list = bilby_pipe.job_creation.bilby_pipe_dag_creator.get_detectors_list(
             inputs
         )
-        self.assertTrue(det_list, [["H1", "L1", "V1"]])
+        self.assertEqual(det_list, [("H1", "L1", "V1")])
 
         self.args.detectors = ["H1", "L1", "V1"]
         self.args.coherence_test = True
@@ -232,7 +232,7 @@ class TestMainInput(unittest.TestCase):
         det_list = bilby_pipe.job_creation.bilby_pipe_dag_creator.get_detectors_list(
             inputs
         )
-        self.assertTrue(det_list, [["H1", "L1", "V1"], ["H1"], ["L1"], ["V1"]])
+        self.assertEqual(det_list, [("H1", "L1", "V1"), ("H1",), ("L1",), ("V1",)])
 
 
 if __name__ == "__main__":
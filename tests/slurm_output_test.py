@@ -1,6 +1,7 @@
 import os
 import shutil
 import unittest
+from unittest.mock import patch
 
 import bilby_pipe
 
@@ -32,6 +33,29 @@ class TestSlurm(unittest.TestCase):
         filename = os.path.join(self.outdir, "submit/slurm_label_master.sh")
         self.assertTrue(os.path.exists(filename))
 
+    def test_local_generation_removes_all_generation_nodes(self):
+        args_list = self.known_args_list + [
+            "--gaussian-noise",
+            "--n-simulation",
+            "3",
+            "--local-generation",
+            "--label",
+            "local",
+        ]
+        inputs = bilby_pipe.main.MainInput(*self.parser.parse_known_args(args_list))
+        with patch("bilby_pipe.job_creation.slurm.subprocess.run") as mock_run:
+            bilby_pipe.main.generate_dag(inputs)
+        self.assertEqual(mock_run.call_count, 3)
+        for call in mock_run.call_args_list:
+            cmd = call[0][0]
+            self.assertTrue(cmd[0].endswith("bilby_pipe_generation"))
+            self.assertIn("--trigger-time", cmd)
+            self.assertNotIn("shell", call[1])
+        filename = os.path.join(self.outdir, "submit/slurm_local_master.sh")
+        with open(filename, "r") as ff:
+            master = ff.read()
+        self.assertNotIn("_generation", master)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -177,6 +177,26 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(
             ["H1", "L1"], bilby_pipe.utils.convert_detectors_input(["L1", "H1"])
         )
+        self.assertEqual(
+            ["H1", "L1"], bilby_pipe.utils.convert_detectors_input("l1 H1 L1")
+        )
+
+    def test_relative_path(self):
+        cwd = os.getcwd()
+        for path, expected in [
+            ("./outdir//sub/", "outdir/sub"),
+            (os.path.join(cwd, "outdir"), "outdir"),
+            (f"../{os.path.basename(cwd)}/outdir", "outdir"),
+            ("outdir/..", "."),
+        ]:
+            self.assertEqual(bilby_pipe.utils.relative_path(path), expected)
+            self.assertEqual(expected, os.path.relpath(path))
+
+    def test_convert_detectors_input_canonical_list(self):
+        detectors = ["H1", "L1", "V1"]
+        out = bilby_pipe.utils.convert_detectors_input(detectors)
+        self.assertEqual(out, detectors)
+        self.assertIsNot(out, detectors)
 
     def test_convert_prior_string_input_simpe(self):
         self.assertEqual(dict(a="1", b="2"), convert_prior_string_input("{a: 1, b:2}"))